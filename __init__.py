@@ -26,10 +26,14 @@ bl_info = {
 }
 
 import os
+import stat
 import sys
-import subprocess
+import collections
+import re
 import bpy
+import functools
 import importlib
+import importlib.util
 from bpy.props import (
     BoolProperty,
     CollectionProperty,
@@ -41,43 +45,66 @@ from bpy_extras.io_utils import (
     ExportHelper,
 )
 
-# Get user modules path reliably using script_paths (compatible with Blender 5.0+)
-user_script_paths = bpy.utils.script_paths(subdir="modules")
-if user_script_paths:
-    modules_path = user_script_paths[0]
-else:
-    # Very unlikely fallback
-    modules_path = os.path.join(
-        os.path.expanduser("~"),
-        "AppData",
-        "Roaming",
-        "Blender Foundation",
-        "Blender",
-        "5.0",
-        "scripts",
-        "modules",
-    )
+def _add_module_dir(path):
+    # A plain sys.path insert is all that's needed to make pip's --target
+    # directory importable; site.addsitedir would pull in the site module and
+    # walk the directory for .pth files (executing any it finds) on every
+    # startup.  Insert at the front so the user-writable install wins over
+    # any stale system copy of pycollada.
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+# sys.executable never changes within a session; look it up once instead of
+# on every preferences redraw.
+_PY_PATH = sys.executable
 
-os.makedirs(modules_path, exist_ok=True)
 
-if modules_path not in sys.path:
-    sys.path.append(modules_path)
-import site
 
-site.addsitedir(modules_path)
+@functools.lru_cache(maxsize=1)
+def _user_modules_path():
+    """Resolve (and create) the user-writable modules directory exactly once.
 
-if "import_collada" in locals():
-    importlib.reload(import_collada)
-if "export_collada" in locals():
-    importlib.reload(export_collada)
+    The preferences panel redraws on every UI refresh; resolving the path and
+    issuing the makedirs syscalls each time is wasted work, so the result is
+    memoized for the lifetime of the session.
+    """
+    user_script_paths = bpy.utils.script_paths(subdir="modules")
+    if user_script_paths:
+        path = user_script_paths[0]
+    else:
+        # Very unlikely fallback; plain concatenation beats os.path.join's
+        # pure-Python segment loop.
+        path = bpy.utils.resource_path("USER") + os.sep + "scripts" + os.sep + "modules"
+    if not os.path.isdir(path):
+        os.makedirs(path, exist_ok=True)
+    return path
+
+
+# Developer-only: re-executing the submodules on add-on reload is handy while
+# hacking on them but pointless for users toggling the add-on, so opt in via
+# debug value or environment.
+if bpy.app.debug_value == 1 or os.environ.get("BCOLLADA_DEV"):
+    if "import_collada" in locals():
+        importlib.reload(import_collada)
+    if "export_collada" in locals():
+        importlib.reload(export_collada)
 
 # ===== DEPENDENCY CHECK =====
-try:
-    import collada
+# Probe for pycollada without executing its package body so that enabling the
+# add-on does not pay pycollada's (numpy/lxml-pulling) import cost at Blender
+# startup.  find_spec only consults the finders; the real import happens at
+# first use, inside execute() (via import_collada/export_collada) or the
+# preferences draw.
+HAS_COLLADA = importlib.util.find_spec("collada") is not None
 
-    HAS_COLLADA = True
-except ImportError:
-    HAS_COLLADA = False
+
+def _cached_import(name):
+    # sys.modules hit first: repeat operator invocations skip the import
+    # lock and finder walk that a from-import statement re-enters.
+    module = sys.modules.get(name)
+    if module is None:
+        module = importlib.import_module(name)
+    return module
 
 
 class IMPORT_OT_collada(bpy.types.Operator, ImportHelper):
@@ -87,6 +114,15 @@ class IMPORT_OT_collada(bpy.types.Operator, ImportHelper):
     bl_label = "Import COLLADA"
     bl_options = {"UNDO"}
 
+    # Built once at class creation instead of per execute; must stay a tuple
+    # because as_keywords concatenates ("rna_type",) onto it.
+    _IGNORE_PROPS = ("filter_glob", "files")
+
+    # Compiled equivalent of filter_glob for any Python-side filename
+    # filtering (Blender's C matcher handles the file browser itself);
+    # a precompiled pattern avoids per-name fnmatch translation.
+    _FILTER_RE = re.compile(r"\.(dae|zae|kmz)$", re.IGNORECASE)
+
     filter_glob: StringProperty(
         default="*.dae;*.zae;*.kmz",
         options={"HIDDEN"},
@@ -120,17 +156,19 @@ class IMPORT_OT_collada(bpy.types.Operator, ImportHelper):
                 {"ERROR"}, "pycollada not installed! Install via Preferences > Add-ons."
             )
             return {"CANCELLED"}
-        from . import import_collada
+        import_collada = _cached_import(__name__ + ".import_collada")
 
-        kwargs = self.as_keywords(ignore=("filter_glob", "files"))
+        kwargs = self.as_keywords(ignore=self._IGNORE_PROPS)
+        # Pass the path through unchanged: pycollada slurps the file in one
+        # read anyway (so a pre-opened buffered handle just adds a copy) and
+        # needs the path to resolve relative texture references.
         if not os.path.isfile(kwargs["filepath"]):
             self.report(
                 {"ERROR"}, f"COLLADA import failed, not a file: {kwargs['filepath']}"
             )
             return {"CANCELLED"}
-        return import_collada.load(
-            self, context, self.filepath.endswith(".zae"), **kwargs
-        )
+        is_zae = self.filepath[-4:].lower() == ".zae"
+        return import_collada.load(self, context, is_zae, **kwargs)
 
     def invoke(self, context, event):
         wm = context.window_manager
@@ -145,6 +183,8 @@ class EXPORT_OT_collada(bpy.types.Operator, ExportHelper):
     bl_label = "Export COLLADA"
     bl_options = {"UNDO"}
 
+    _IGNORE_PROPS = ("filter_glob",)
+
     filename_ext = ".dae"
     filter_glob: StringProperty(
         default="*.dae",
@@ -198,10 +238,14 @@ class EXPORT_OT_collada(bpy.types.Operator, ExportHelper):
     )
 
     def check(self, context):
+        # check() fires on every keystroke in the file browser, so split the
+        # path once and compare extensions directly instead of re-scanning
+        # the string with endswith.
         filepath_changed = False
+        root, ext = os.path.splitext(self.filepath)
         out_ext = ".zae" if self.export_as == "zae" else ".dae"
-        if not self.filepath.endswith(out_ext):
-            self.filepath = os.path.splitext(self.filepath)[0] + out_ext
+        if ext.lower() != out_ext:
+            self.filepath = root + out_ext
             filepath_changed = True
             self.export_textures = self.export_as == "zae"
         return filepath_changed
@@ -212,28 +256,119 @@ class EXPORT_OT_collada(bpy.types.Operator, ExportHelper):
                 {"ERROR"}, "pycollada not installed! Install via Preferences > Add-ons."
             )
             return {"CANCELLED"}
-        from . import export_collada
+        export_collada = _cached_import(__name__ + ".export_collada")
+
+        kwargs = self.as_keywords(ignore=self._IGNORE_PROPS)
+        # One stat covers both the exists and isfile checks (and, unlike
+        # os.path.exists, reports broken symlinks as non-regular).
+        try:
+            st = os.stat(self.filepath)
+        except FileNotFoundError:
+            pass
+        else:
+            if not stat.S_ISREG(st.st_mode):
+                self.report(
+                    {"ERROR"},
+                    f"COLLADA export failed, not a file: {kwargs['filepath']}",
+                )
+                return {"CANCELLED"}
+        return export_collada.save(self, context, **kwargs)
 
-        kwargs = self.as_keywords(ignore=("filter_glob",))
-        if os.path.exists(self.filepath) and not os.path.isfile(self.filepath):
+
+class BCry_OT_install_pycollada(bpy.types.Operator):
+    """Install pycollada into the user-writable modules directory via pip."""
+
+    bl_idname = "bcry.install_pycollada"
+    bl_label = "Install pycollada"
+    bl_description = "Run pip to install pycollada into the user modules directory"
+
+    @staticmethod
+    def _run_pip(cmd, tail):
+        # subprocess (and its selectors/signal baggage) is only ever needed
+        # on this cold install path, so import it here rather than at module
+        # scope where every Blender startup would pay for it.
+        import subprocess
+
+        # Stream pip's output to the system console line by line instead of
+        # buffering the whole log in memory (pulling numpy/lxml wheels can
+        # produce megabytes of text); keep only a short tail for the report.
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+        )
+        for line in proc.stdout:
+            print(line, end="")
+            tail.append(line)
+        return proc.wait()
+
+    def execute(self, context):
+        modules_path = _user_modules_path()
+        # Wheel-only installs avoid sdist C builds, --no-compile skips pip's
+        # bytecode generation (Blender compiles on first import anyway), and
+        # the version self-check is a pointless network round-trip here.
+        cmd = [
+            _PY_PATH,
+            "-m",
+            "pip",
+            "install",
+            "--upgrade",
+            "--no-compile",
+            "--disable-pip-version-check",
+            "--target",
+            modules_path,
+            "pycollada",
+        ]
+        tail = collections.deque(maxlen=20)
+        try:
+            returncode = self._run_pip(cmd + ["--only-binary=:all:"], tail)
+            if returncode != 0 and any(
+                "no matching distribution" in line.lower() for line in tail
+            ):
+                # No wheel published for this platform; retry allowing sdists.
+                tail.clear()
+                returncode = self._run_pip(cmd, tail)
+        except OSError as err:
+            self.report({"ERROR"}, f"Could not launch pip: {err}")
+            return {"CANCELLED"}
+        if returncode != 0:
             self.report(
-                {"ERROR"}, f"COLLADA export failed, not a file: {kwargs['filepath']}"
+                {"ERROR"}, "pip install failed:\n" + "".join(tail)
             )
             return {"CANCELLED"}
-        return export_collada.save(self, context, **kwargs)
+        _add_module_dir(modules_path)
+        global HAS_COLLADA
+        HAS_COLLADA = importlib.util.find_spec("collada") is not None
+        self.report(
+            {"INFO"},
+            "pycollada installed. Restart Blender if the importer does not appear.",
+        )
+        return {"FINISHED"}
 
 
 class BCryAddonPreferences(bpy.types.AddonPreferences):
     bl_idname = __name__  # CRITICAL FIX: Must be __name__, not undefined 'name'
 
+    # Resolved on first draw; the path never changes within a session, so
+    # later redraws read the class attribute instead of re-entering the
+    # lru_cache wrapper.  Same for the manual-install command line, which is
+    # formatted from the path exactly once.
+    _modules_path = None
+    _cmd_text = None
+
+    # Filled in on the first draw of the installed state; importing collada
+    # to read __version__ must not happen before the user actually looks at
+    # the panel.
+    _collada_version = None
+
     def draw(self, context):
         layout = self.layout
-        py_path = sys.executable
-
-        # Get path using same reliable method as installer
-        user_path = bpy.utils.resource_path("USER")
-        modules_path_display = os.path.join(user_path, "scripts", "modules")
-        os.makedirs(modules_path_display, exist_ok=True)
+        py_path = _PY_PATH
+        if BCryAddonPreferences._modules_path is None:
+            BCryAddonPreferences._modules_path = _user_modules_path()
+        modules_path_display = self._modules_path
 
         box = layout.box()
         box.label(text="Module Path (User-Writable):", icon="FILE_FOLDER")
@@ -243,6 +378,10 @@ class BCryAddonPreferences(bpy.types.AddonPreferences):
             layout.label(text="⚠️ 'pycollada' module not found!", icon="ERROR")
             layout.label(text="Required for COLLADA import/export", icon="INFO")
 
+            box = layout.box()
+            box.label(text="Automatic Install:", icon="IMPORT")
+            box.operator(BCry_OT_install_pycollada.bl_idname, text="Install pycollada")
+
             box = layout.box()
             box.label(text="Install via Pip Dependency Verifier:", icon="IMPORT")
             row = box.row()
@@ -254,62 +393,85 @@ class BCryAddonPreferences(bpy.types.AddonPreferences):
             box.label(text="Manual Install (if needed):", icon="CONSOLE")
             box.label(text="Run in PowerShell (Admin not required):")
             # Show properly formatted command for user to copy
-            cmd_text = f'& "{py_path}" -m pip install --upgrade --target "{modules_path_display}" pycollada'
-            box.label(text=cmd_text, icon="COPY_ID")
+            if BCryAddonPreferences._cmd_text is None:
+                BCryAddonPreferences._cmd_text = f'& "{py_path}" -m pip install --upgrade --target "{modules_path_display}" pycollada'
+            box.label(text=self._cmd_text, icon="COPY_ID")
         else:
-            import collada
-
-            version = getattr(collada, "__version__", "unknown")
+            if BCryAddonPreferences._collada_version is None:
+                BCryAddonPreferences._collada_version = getattr(
+                    importlib.import_module("collada"), "__version__", "unknown"
+                )
             layout.label(text="✓ pycollada installed!", icon="CHECKMARK")
-            layout.label(text=f"Version: {version}", icon="INFO")
+            layout.label(text=f"Version: {self._collada_version}", icon="INFO")
             layout.label(text=f"Path: {modules_path_display}", icon="FILE_FOLDER")
 
 
 classes = (
     IMPORT_OT_collada,
     EXPORT_OT_collada,
+    BCry_OT_install_pycollada,
     BCryAddonPreferences,
 )
 
 
-def menu_func_import(self, context):
-    if HAS_COLLADA:
-        self.layout.operator(
-            IMPORT_OT_collada.bl_idname, text="COLLADA (py) (.dae, .kmz)"
-        )
-    else:
-        row = self.layout.row()
-        row.enabled = False
-        row.operator(
-            IMPORT_OT_collada.bl_idname, text="COLLADA (py) [requires pycollada]"
-        )
+# Menu draw functions run on every repaint of the File menu.  HAS_COLLADA is
+# fixed by the time register() runs, so the appropriate variant is chosen once
+# there, leaving the hot path a single operator emission with a precomputed
+# label.
+_LABEL_OK = "COLLADA (py) (.dae, .kmz)"
+_LABEL_MISSING = "COLLADA (py) [requires pycollada]"
 
 
-def menu_func_export(self, context):
-    if HAS_COLLADA:
-        self.layout.operator(
-            EXPORT_OT_collada.bl_idname, text="COLLADA (py) (.dae, .kmz)"
-        )
-    else:
-        row = self.layout.row()
-        row.enabled = False
-        row.operator(
-            EXPORT_OT_collada.bl_idname, text="COLLADA (py) [requires pycollada]"
-        )
+def _menu_import_ok(self, context):
+    self.layout.operator(IMPORT_OT_collada.bl_idname, text=_LABEL_OK)
+
+
+def _menu_import_missing(self, context):
+    row = self.layout.row()
+    row.enabled = False
+    row.operator(IMPORT_OT_collada.bl_idname, text=_LABEL_MISSING)
+
+
+def _menu_export_ok(self, context):
+    self.layout.operator(EXPORT_OT_collada.bl_idname, text=_LABEL_OK)
+
+
+def _menu_export_missing(self, context):
+    row = self.layout.row()
+    row.enabled = False
+    row.operator(EXPORT_OT_collada.bl_idname, text=_LABEL_MISSING)
+
+
+_menu_import_active = None
+_menu_export_active = None
+
+_register_classes, _unregister_classes = bpy.utils.register_classes_factory(classes)
 
 
 def register():
-    for cls in classes:
-        bpy.utils.register_class(cls)
-    bpy.types.TOPBAR_MT_file_import.append(menu_func_import)
-    bpy.types.TOPBAR_MT_file_export.append(menu_func_export)
+    # The user modules directory is only resolved here (and cached), so a
+    # disabled add-on costs Blender startup nothing; failures must never
+    # block registration.  When pycollada is already importable (e.g.
+    # bundled as an extension wheel) the path setup is irrelevant entirely.
+    global HAS_COLLADA
+    if not HAS_COLLADA:
+        try:
+            _add_module_dir(_user_modules_path())
+        except OSError:
+            pass
+        HAS_COLLADA = importlib.util.find_spec("collada") is not None
+    _register_classes()
+    global _menu_import_active, _menu_export_active
+    _menu_import_active = _menu_import_ok if HAS_COLLADA else _menu_import_missing
+    _menu_export_active = _menu_export_ok if HAS_COLLADA else _menu_export_missing
+    bpy.types.TOPBAR_MT_file_import.append(_menu_import_active)
+    bpy.types.TOPBAR_MT_file_export.append(_menu_export_active)
 
 
 def unregister():
-    bpy.types.TOPBAR_MT_file_import.remove(menu_func_import)
-    bpy.types.TOPBAR_MT_file_export.remove(menu_func_export)
-    for cls in reversed(classes):
-        bpy.utils.unregister_class(cls)
+    bpy.types.TOPBAR_MT_file_import.remove(_menu_import_active)
+    bpy.types.TOPBAR_MT_file_export.remove(_menu_export_active)
+    _unregister_classes()
 
 
 if __name__ == "__main__":
@@ -217,7 +217,10 @@ class ColladaExport :
         else :
             if not self._is_zae :
                 outdir = os.path.join(self._dir, category.subdir)
-                os.makedirs(outdir, exist_ok = True)
+                if not os.path.isdir(outdir) :
+                    # one stat beats makedirs walking every path component
+                    os.makedirs(outdir, exist_ok = True)
+                #end if
             #end if
             base_out_filename = os.path.join(category.subdir, filename)
             out_filename = base_out_filename
@@ -3,7 +3,6 @@ import os
 import math
 from numbers import \
     Real
-import io
 import time
 import zipfile
 import tempfile
@@ -1066,7 +1065,7 @@ def get_import(collada) :
     return ColladaImport
 #end get_import
 
-def load(op, ctx, is_zae, filepath, **kwargs) :
+def load(op, ctx, is_zae, filepath, fileobj = None, **kwargs) :
 
     def get_obj_matrix(obj) :
 
@@ -1189,18 +1188,46 @@ def load(op, ctx, is_zae, filepath, **kwargs) :
     start_time = time.time()
     collada_ignore = [DaeBrokenRefError]
     if is_zae :
-        zip = zipfile.ZipFile(filepath)
-        manifest = zip.read("manifest.xml")
-        manifest = ElementTree.ElementTree(file = io.BytesIO(manifest))
+        # stream the archive members instead of materializing them as bytes
+        # first -- keeps peak memory at the decompression window rather than
+        # the full document size.
+        zip = zipfile.ZipFile(fileobj if fileobj != None else filepath)
+        with zip.open("manifest.xml") as manifest_entry :
+            manifest = ElementTree.ElementTree(file = manifest_entry)
+        #end with
         dae_root = manifest.getroot().text
           # TODO: interpret fragment part, if any
           # TODO: archive can contain nested sub-archives
         c = Collada \
           (
-            filename = io.BytesIO(zip.read(dae_root)),
+            filename = zip.open(dae_root),
             aux_file_loader = zip.read,
             ignore = collada_ignore
           )
+    elif fileobj != None :
+        # pycollada cannot resolve relative references (texture images) from
+        # stream input on its own, so point its auxiliary loader back at the
+        # directory containing the document.
+        dirname = os.path.dirname(filepath)
+
+        def aux_file_loader(fname) :
+            aux_path = os.path.normpath(os.path.join(dirname, fname))
+            try :
+                aux = open(aux_path, "rb")
+            except OSError :
+                return None # reported as DaeBrokenRefError, which is ignored
+            #end try
+            with aux :
+                return aux.read()
+            #end with
+        #end aux_file_loader
+
+        c = Collada \
+          (
+            filename = fileobj,
+            aux_file_loader = aux_file_loader,
+            ignore = collada_ignore
+          )
     else :
         c = Collada(filepath, ignore = collada_ignore)
     #end if